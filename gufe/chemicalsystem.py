@@ -47,7 +47,7 @@ class ChemicalSystem(GufeTokenizable, abc.Mapping):
     def _to_dict(self):
         return {
             "components": {
-                key: value for key, value in sorted(self.components.items())
+                key: value for key, value in sorted(self._components.items())
             },
             "name": self.name,
         }
@@ -96,14 +96,16 @@ class ChemicalSystem(GufeTokenizable, abc.Mapping):
                 total_charge += fc
         return total_charge
 
+    # Mapping interface reads the internal dict directly; ``components``
+    # returns a copy, which we don't want to make on every lookup
     def __getitem__(self, item):
-        return self.components[item]
+        return self._components[item]
 
     def __iter__(self):
-        return iter(self.components)
+        return iter(self._components)
 
     def __len__(self):
-        return len(self.components)
+        return len(self._components)
 
     @classmethod
     def _defaults(cls):
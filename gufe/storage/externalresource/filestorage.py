@@ -42,14 +42,31 @@ class FileStorage(ExternalStorage):
             shutil.copyfile(path, my_path)
 
     def _iter_contents(self, prefix):
+        # resolve the root once, rather than once per file/directory
+        root = self.root_dir.resolve()
         start_dir = (self.root_dir / pathlib.Path(prefix).parent).resolve()
-        for dirpath, _, filenames in os.walk(start_dir):
+        for dirpath, dirnames, filenames in os.walk(start_dir):
+            dirpath = pathlib.Path(dirpath)
+            # prune subdirectories that can't contain a match, so that we
+            # only walk the part of the tree that the prefix selects
+            dirnames[:] = [
+                dirname for dirname in dirnames
+                if self._dir_may_match(
+                    str((dirpath / dirname).relative_to(root)), prefix
+                )
+            ]
             for filename in filenames:
-                path = pathlib.Path(dirpath) / filename
-                location = self._get_location(path)
+                location = str((dirpath / filename).relative_to(root))
                 if location.startswith(prefix):
                     yield location
 
+    @staticmethod
+    def _dir_may_match(dir_location, prefix):
+        # locations under this directory all start with dir_location + "/"
+        dir_location += "/"
+        return (dir_location.startswith(prefix)
+                or prefix.startswith(dir_location))
+
     def _delete(self, location):
         path = self._as_path(location)
         if self.exists(location):
@@ -1,5 +1,6 @@
 # This code is part of OpenFE and is licensed under the MIT license.
 # For details, see https://github.com/OpenFreeEnergy/gufe
+import bisect
 import io
 from typing import Union, Tuple, ContextManager
 
@@ -14,6 +15,8 @@ class MemoryStorage(ExternalStorage):
     """Not for production use, but potentially useful in testing"""
     def __init__(self):
         self._data = {}
+        # sorted index of locations, so prefix searches can use bisect
+        self._locations = []
 
     def _exists(self, location):
         return location in self._data
@@ -26,10 +29,14 @@ class MemoryStorage(ExternalStorage):
                 f"Unable to delete '{location}': key does not exist"
             )
 
+        del self._locations[bisect.bisect_left(self._locations, location)]
+
     def __eq__(self, other):
         return self is other
 
     def _store_bytes(self, location, byte_data):
+        if location not in self._data:
+            bisect.insort(self._locations, location)
         self._data[location] = byte_data
         return location, self.get_metadata(location)
 
@@ -40,9 +47,15 @@ class MemoryStorage(ExternalStorage):
         return self._store_bytes(location, byte_data)
 
     def _iter_contents(self, prefix):
-        for label in self._data:
-            if label.startswith(prefix):
-                yield label
+        # matching labels are contiguous in the sorted index
+        locations = self._locations
+        start = bisect.bisect_left(locations, prefix)
+        end = start
+        while end < len(locations) and locations[end].startswith(prefix):
+            end += 1
+
+        # iterate over a copy, so it is safe to delete while iterating
+        yield from locations[start:end]
 
     def _get_filename(self, location):
         # TODO: how to get this to work? how to manage tempfile? maybe a
@@ -32,6 +32,18 @@ def file_storage(tmp_path):
     return FileStorage(tmp_path)
 
 
+@pytest.fixture
+def nested_file_storage(tmp_path):
+    """FileStorage with empty files a/b/c/d.txt, a/bb/e.txt, f/g.txt"""
+    for file in ['a/b/c/d.txt', 'a/bb/e.txt', 'f/g.txt']:
+        path = tmp_path / file
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(b"")
+
+    return FileStorage(tmp_path)
+
+
 class TestFileStorage:
     @pytest.mark.parametrize('filename, expected', [
         ('foo.txt', True),
@@ -107,6 +119,39 @@ class TestFileStorage:
 
         assert set(storage.iter_contents(prefix)) == expected
 
+    @pytest.mark.parametrize('prefix,expected', [
+        ("", {'a/b/c/d.txt', 'a/bb/e.txt', 'f/g.txt'}),
+        ("a/", {'a/b/c/d.txt', 'a/bb/e.txt'}),
+        ("a/b", {'a/b/c/d.txt', 'a/bb/e.txt'}),
+        ("a/b/", {'a/b/c/d.txt'}),
+        ("a/b/c/d", {'a/b/c/d.txt'}),
+        ("f/h", set()),
+    ])
+    def test_iter_contents_nested(self, nested_file_storage, prefix,
+                                  expected):
+        storage = nested_file_storage
+        assert set(storage.iter_contents(prefix)) == expected
+
+    def test_iter_contents_prunes_walk(self, nested_file_storage):
+        storage = nested_file_storage
+        root = storage.root_dir.resolve()
+        walked = []
+        real_walk = os.walk
+
+        def recording_walk(top):
+            for dirpath, dirnames, filenames in real_walk(top):
+                walked.append(pathlib.Path(dirpath).relative_to(root))
+                # yield the same dirnames list, so pruning still applies
+                yield dirpath, dirnames, filenames
+
+        with mock.patch("os.walk", recording_walk):
+            contents = set(storage.iter_contents("a/b/"))
+
+        assert contents == {'a/b/c/d.txt'}
+        assert set(walked) == {
+            pathlib.Path("a"), pathlib.Path("a/b"), pathlib.Path("a/b/c")
+        }
+
     def test_delete_error_not_existing(self, file_storage):
         with pytest.raises(MissingExternalResourceError,
                            match="does not exist"):
@@ -132,7 +177,8 @@ class TestMemoryStorage:
     def setup_method(self):
         self.contents = {'path/to/foo.txt': 'bar'.encode('utf-8')}
         self.storage = MemoryStorage()
-        self.storage._data = dict(self.contents)
+        for loc, byte_data in self.contents.items():
+            self.storage.store_bytes(loc, byte_data)
 
     @pytest.mark.parametrize('expected', [True, False])
     def test_exists(self, expected):
@@ -184,14 +230,64 @@ class TestMemoryStorage:
     ])
     def test_iter_contents(self, prefix, expected):
         storage = MemoryStorage()
-        storage._data = {
-            "foo.txt": b"",
-            "foo_dir/a.txt": b"",
-            "foo_dir/b.txt": b"",
-        }
+        for loc in ["foo.txt", "foo_dir/a.txt", "foo_dir/b.txt"]:
+            storage.store_bytes(loc, b"")
 
         assert set(storage.iter_contents(prefix)) == expected
 
+    def test_iter_contents_after_store_delete(self):
+        storage = MemoryStorage()
+        for loc in ["foo_dir/b.txt", "foo.txt", "foo_dir/a.txt"]:
+            storage.store_bytes(loc, b"")
+
+        storage.store_bytes("foo_dir/a.txt", b"overwritten")
+        storage.delete("foo.txt")
+
+        assert list(storage.iter_contents("foo")) == [
+            "foo_dir/a.txt", "foo_dir/b.txt"
+        ]
+
+    @pytest.mark.parametrize('prefix', ["a", "m", "z"])
+    def test_iter_contents_no_full_scan(self, prefix):
+        class CountingList(list):
+            # count how many items get looked at
+            def __init__(self, *args):
+                super().__init__(*args)
+                self.accessed = 0
+
+            def __getitem__(self, item):
+                self.accessed += 1
+                return super().__getitem__(item)
+
+            def __iter__(self):
+                for item in super().__iter__():
+                    self.accessed += 1
+                    yield item
+
+        storage = MemoryStorage()
+        for first in "abcdefghijklmnopqrstuvwxyz":
+            for i in range(40):
+                storage.store_bytes(f"{first}/{i}.txt", b"")
+
+        storage._locations = CountingList(storage._locations)
+
+        assert len(list(storage.iter_contents(prefix))) == 40
+        # bisect (~10 lookups) + matches (40) + one non-match + the slice
+        assert storage._locations.accessed < 60
+
+    def test_iter_contents_delete_while_iterating(self):
+        storage = MemoryStorage()
+        for loc in ["p/a", "p/b", "p/c", "p/d"]:
+            storage.store_bytes(loc, b"")
+
+        deleted = []
+        for loc in storage.iter_contents("p/"):
+            storage.delete(loc)
+            deleted.append(loc)
+
+        assert deleted == ["p/a", "p/b", "p/c", "p/d"]
+        assert list(storage.iter_contents("")) == []
+
     def test_get_filename(self):
         pytest.skip("Not implemented yet")
 
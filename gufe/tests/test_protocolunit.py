@@ -1,6 +1,7 @@
 import string
 import pytest
 from pathlib import Path
+from unittest import mock
 
 from gufe.protocols.protocolunit import ProtocolUnit, Context, ProtocolUnitFailure, ProtocolUnitResult
 from gufe.tests.test_tokenization import GufeTokenizableTestsMixin
@@ -46,6 +47,13 @@ class TestProtocolUnit(GufeTokenizableTestsMixin):
         u2 = DummyUnit()
         assert u1.key != u2.key
 
+    def test_from_dict_reuses_registered(self, dummy_unit):
+        # a unit already in memory should be returned without rebuilding it
+        dct = dummy_unit.to_dict()
+        with mock.patch.object(DummyUnit, '_from_dict',
+                               side_effect=AssertionError):
+            assert DummyUnit.from_dict(dct) is dummy_unit
+
     def test_execute(self, tmpdir):
         with tmpdir.as_cwd():
 
@@ -333,6 +333,10 @@ class GufeTokenizable(abc.ABC, metaclass=_ABCGufeClassMeta):
         return self.key < other.key
 
     def __eq__(self, other):
+        # the registry deduplicates equal objects, so identity is common
+        if self is other:
+            return True
+
         if not isinstance(other, self.__class__):
             return False
 
@@ -764,6 +768,12 @@ def key_encode_dependencies(obj: GufeTokenizable) -> dict:
 
 # decode options
 def from_dict(dct) -> GufeTokenizable:
+    # objects that serialize their own key (e.g., ProtocolUnits) can be
+    # reused from the registry without being reconstructed
+    if (key := dct.get('_key')) is not None:
+        if (thing := TOKENIZABLE_REGISTRY.get(key)) is not None:
+            return thing
+
     obj = _from_dict(dct)
     # When __new__ is called to create ``obj``, it should be added to the
     # TOKENIZABLE_REGISTRY. However, there seems to be some case (race